@@ -0,0 +1,90 @@
+"""How fast follow-ups like "and tomorrow?" resolve against the conversation context.
+
+Run from the myassist directory:
+
+    python benchmarks/bench_follow_ups.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from context import ConversationContext
+from skill_registry import SkillRegistry, BUILTIN_SKILLS_DIR
+
+# (previous intent, its slots, follow-up, expected slot update or None for a new request)
+CORPUS = [
+    ("weather", {"location": "london", "day": "today"}, "and tomorrow?", {"day": "tomorrow"}),
+    ("weather", {"location": "london", "day": "today"}, "what about paris?", {"subject": "paris"}),
+    ("weather", {"location": "london", "day": "today"}, "how about in new york", {"subject": "new york"}),
+    ("weather", {"location": "paris", "day": "today"}, "and what about berlin?", {"subject": "berlin"}),
+    ("weather", {"location": "paris", "day": "today"}, "and how about tomorrow", {"day": "tomorrow"}),
+    ("weather", {"location": "paris", "day": "today"}, "and what about in rome", {"subject": "rome"}),
+    ("weather", {"location": "paris", "day": "tomorrow"}, "and how about the day after tomorrow", {"day": "day after tomorrow"}),
+    ("weather", {"location": "paris", "day": "today"}, "what about tonight?", {"day": "tonight"}),
+    ("weather", {"location": "paris", "day": "today"}, "anderson cooper", None),
+    ("weather", {"location": "paris", "day": "tomorrow"}, "and the day after tomorrow", {"day": "day after tomorrow"}),
+    ("weather", {"location": "paris", "day": "today"}, "and tonight", {"day": "tonight"}),
+    ("weather", {"location": "paris", "day": "today"}, "and what time is it", None),
+    ("weather", {"location": "paris", "day": "today"}, "what about dayton", {"subject": "dayton"}),
+    ("weather", {"location": "paris", "day": "today"}, "and what about playa del carmen", {"subject": "playa del carmen"}),
+    ("weather", {"location": "paris", "day": "today"}, "how about timbuktu", {"subject": "timbuktu"}),
+    ("weather", {"location": "paris", "day": "today"}, "how about stockholm", {"subject": "stockholm"}),
+    ("weather", {"location": "paris", "day": "today"}, "what about the news", None),
+    ("weather", {"location": "paris", "day": "today"}, "tell me a joke", None),
+    ("get_wikipedia_info", {"topic": "albert einstein"}, "what about isaac newton", {"subject": "isaac newton"}),
+    ("get_wikipedia_info", {"topic": "albert einstein"}, "and tomorrow", None),
+    ("tell_joke", {"joke": 1}, "what about paris", None),
+]
+
+
+def resolve(registry, context, intent, slots, command):
+    context.start_turn(intent)
+    context.record(slots)
+    follow_up = registry.resolve_follow_up(context, command)
+    return follow_up[2] if follow_up else None
+
+
+def bench_resolution(rounds=2000):
+    registry = SkillRegistry([BUILTIN_SKILLS_DIR], use_entry_points=False)
+    context = ConversationContext()
+
+    correct = 0
+    for intent, slots, command, expected in CORPUS:
+        got = resolve(registry, context, intent, slots, command)
+        if got == expected:
+            correct += 1
+        else:
+            print(f"  {command!r} after {intent}: expected {expected}, got {got}")
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for intent, slots, command, _ in CORPUS:
+            resolve(registry, context, intent, slots, command)
+    per_call = (time.perf_counter() - start) / (rounds * len(CORPUS)) * 1e6
+
+    print("Follow-up resolution")
+    print(f"  correct: {correct}/{len(CORPUS)}")
+    print(f"  {per_call:.1f} us per follow-up (vs. opening a browser search)")
+
+
+def bench_cache(rounds=100000):
+    context = ConversationContext(max_results=16)
+    for i in range(1000):
+        context.cache_result("weather", {"location": f"city {i}"}, {"temperature": i})
+
+    start = time.perf_counter()
+    for i in range(rounds):
+        context.cached_result("weather", {"location": f"city {990 + i % 10}"})
+    per_call = (time.perf_counter() - start) / rounds * 1e6
+
+    print("Result cache")
+    print(f"  entries after 1000 inserts: {len(context.results)} (limit {context.max_results})")
+    print(f"  {per_call:.2f} us per cached lookup")
+
+
+if __name__ == "__main__":
+    bench_resolution()
+    print()
+    bench_cache()
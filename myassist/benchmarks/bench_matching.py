@@ -0,0 +1,173 @@
+"""Accuracy and latency of wake word and intent matching on misrecognized speech.
+
+Run from the myassist directory:
+
+    python benchmarks/bench_matching.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from phonetic import PhoneticIndex
+from skill_registry import SkillRegistry, BUILTIN_SKILLS_DIR
+
+# Same list as WAKE_WORDS in voice_assist.py
+WAKE_WORDS = ["alexa", "hey alexa", "ok alexa", "computer", "echo"]
+
+# Recognizer output for utterances that did start with a wake word
+WAKE_CORPUS = [
+    "alexa what time is it",
+    "hey alexa play some music",
+    "alexia what's the weather",
+    "a lexa tell me a joke",
+    "alexis set a timer",
+    "elexa open youtube",
+    "hey alex a what's the news",
+    "ok alexa",
+    "okay lexa",
+    "computers what is the date",
+    "computer",
+    "compute her open google",
+    "komputer volume up",
+    "echo play jazz",
+    "eko tell me a joke",
+    "ecco what's the time",
+    "alexa",
+    "alexsa turn the volume down",
+    "hey alexi",
+    "ah lexa stop",
+]
+
+# Ordinary speech that must not wake the assistant
+NOT_WAKE_CORPUS = [
+    "i'll ask alex about it later",
+    "tell alex to stop",
+    "also we need milk",
+    "the computation took a while",
+    "complete the form",
+    "each of them",
+    "excellent work today",
+    "let's go to the lake",
+    "electric car",
+    "hello there",
+    "i'm going to the shop",
+    "can you pass the salt",
+    "what a nice day",
+]
+
+# (misrecognized command, intent a clean recognition would have routed to)
+INTENT_CORPUS = [
+    ("whether in paris", "weather"),
+    ("what's the wether like", "weather"),
+    ("weathers in london", "weather"),
+    ("remine me to call mom in 5 minutes", "set_reminder"),
+    ("remined me to stretch in 10 minutes", "set_reminder"),
+    ("reminda to buy milk in 1 hour", "set_reminder"),
+    ("tell me a jokes", "tell_joke"),
+    ("make me laff", "tell_joke"),
+    ("volumn up", "control_volume"),
+    ("volum down", "control_volume"),
+    ("headline please", "get_news"),
+    ("head lines", "get_news"),
+    ("calculat 2 plus 2", "calculate"),
+    ("calculated 5 times 3", "calculate"),
+    ("tel me about mars", "get_wikipedia_info"),
+    ("thank u", "thank_you"),
+    ("thanx", "thank_you"),
+    ("goodby", "exit"),
+    ("good bye", "exit"),
+    ("serch for pizza places", "web_search"),
+]
+
+# Commands that match no trigger exactly and should still go to the web search fallback
+NOT_INTENT_CORPUS = [
+    "i think so",
+    "i wonder whether to go",
+    "what's up",
+    "watts",
+    "how tall is mount everest",
+    "best pizza near me",
+    "turn on the lights",
+    "where is my phone",
+    "who won the game last night",
+    "how many ounces in a pound",
+    "order more coffee",
+    "recipe for banana bread",
+]
+
+
+def time_per_call(func, items, rounds=200):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for item in items:
+            func(item)
+    return (time.perf_counter() - start) / (rounds * len(items)) * 1e6
+
+
+def bench_wake_words():
+    index = PhoneticIndex(WAKE_WORDS)
+
+    def exact(text):
+        return any(wake_word in text for wake_word in WAKE_WORDS)
+
+    def fuzzy(text):
+        return exact(text) or index.find(text, at_start=True) is not None
+
+    print("Wake words")
+    print(f"  {'':<10}{'hit rate':>10}{'false wakes':>14}{'us/utterance':>15}")
+    for name, detect in [("exact", exact), ("phonetic", fuzzy)]:
+        hits = sum(detect(text) for text in WAKE_CORPUS)
+        false_wakes = sum(detect(text) for text in NOT_WAKE_CORPUS)
+        latency = time_per_call(detect, WAKE_CORPUS + NOT_WAKE_CORPUS)
+        print(f"  {name:<10}{hits:>5}/{len(WAKE_CORPUS):<4}{false_wakes:>8}/{len(NOT_WAKE_CORPUS):<5}{latency:>15.1f}")
+
+    missed = [text for text in WAKE_CORPUS if not fuzzy(text)]
+    woke = [text for text in NOT_WAKE_CORPUS if fuzzy(text)]
+    if missed:
+        print(f"  still missed: {missed}")
+    if woke:
+        print(f"  false wakes: {woke}")
+
+
+def bench_intents():
+    commands = [command for command, _ in INTENT_CORPUS] + NOT_INTENT_CORPUS
+
+    def false_route(registry, command):
+        return not registry.match(command).fallback
+
+    print("Intents")
+    print(f"  {'':<10}{'correct':>10}{'false routes':>15}{'us/utterance':>15}")
+    for name, fuzzy in [("exact", False), ("phonetic", True)]:
+        registry = SkillRegistry([BUILTIN_SKILLS_DIR], use_entry_points=False, fuzzy=fuzzy)
+        correct = sum(
+            1 for command, expected in INTENT_CORPUS
+            if getattr(registry.match(command), "name", None) == expected
+        )
+        false_routes = sum(false_route(registry, command) for command in NOT_INTENT_CORPUS)
+        latency = time_per_call(registry.match, commands)
+        print(f"  {name:<10}{correct:>5}/{len(INTENT_CORPUS):<4}"
+              f"{false_routes:>9}/{len(NOT_INTENT_CORPUS):<5}{latency:>15.1f}")
+
+    wrong = [
+        (command, getattr(registry.match(command), "name", None))
+        for command, expected in INTENT_CORPUS
+        if getattr(registry.match(command), "name", None) != expected
+    ]
+    if wrong:
+        print(f"  still misrouted: {wrong}")
+
+    routed = [
+        (command, registry.match(command).name)
+        for command in NOT_INTENT_CORPUS
+        if false_route(registry, command)
+    ]
+    if routed:
+        print(f"  false routes: {routed}")
+
+
+if __name__ == "__main__":
+    bench_wake_words()
+    print()
+    bench_intents()
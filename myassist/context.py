@@ -0,0 +1,100 @@
+import re
+import time
+from collections import OrderedDict
+
+# Leading words that mark an elliptical follow-up like "and tomorrow?" or "what about paris?".
+# "and" may be followed by "what about"/"how about", which must not end up in the captured subject.
+FOLLOW_UP_PATTERN = re.compile(r"^(?:and\s+(?:what about\s+|how about\s+)?|what about\s+|how about\s+)(?:in\s+|for\s+)?(.+?)[?.!]*$")
+
+# Follow-ups that change the day rather than the subject
+DAY_WORDS = ["day after tomorrow", "tomorrow", "tonight", "today"]
+
+
+def parse_follow_up(command):
+    """Split a follow-up into the slot it changes.
+
+    Returns {"day": ...} for "and tomorrow?", {"subject": ...} for
+    "what about paris?", or None if the command isn't a follow-up.
+    """
+    match = FOLLOW_UP_PATTERN.match(command.strip().lower())
+    if not match:
+        return None
+
+    rest = re.sub(r"^the\s+", "", match.group(1).strip())
+    for day in DAY_WORDS:
+        if rest == day:
+            return {"day": day}
+    return {"subject": rest}
+
+
+class Turn:
+    """The intent handled in one exchange, with the slots it used and its result"""
+
+    def __init__(self, intent):
+        self.intent = intent
+        self.slots = {}
+        self.result = None
+        self.time = time.monotonic()
+
+
+class ConversationContext:
+    """Short-lived memory of the last exchange plus a small cache of results.
+
+    Memory stays bounded: only the last turn is kept, and at most `max_results`
+    results are cached, oldest evicted first. Both expire after `ttl` seconds.
+    """
+
+    def __init__(self, ttl=120, max_results=16):
+        self.ttl = ttl
+        self.max_results = max_results
+        self.turn = None
+        self.results = OrderedDict()
+
+    @staticmethod
+    def key(intent, slots):
+        return (intent, tuple(sorted(slots.items())))
+
+    def start_turn(self, intent):
+        """Begin a new exchange, replacing whatever the previous one left behind"""
+        self.turn = Turn(intent)
+
+    def record(self, slots, result=None):
+        """Save the slots (and result data, if any) of the current exchange"""
+        if self.turn is None:
+            return
+        self.turn.slots = dict(slots)
+        self.turn.result = result
+        self.turn.time = time.monotonic()
+
+        if result is not None:
+            self.cache_result(self.turn.intent, slots, result)
+
+    def cache_result(self, intent, slots, result):
+        """Keep result data so an identical request can skip the lookup"""
+        key = self.key(intent, slots)
+        self.results[key] = (result, time.monotonic())
+        self.results.move_to_end(key)
+        while len(self.results) > self.max_results:
+            self.results.popitem(last=False)
+
+    def last_turn(self):
+        """The previous exchange if it recorded slots and hasn't expired"""
+        if self.turn is None or not self.turn.slots:
+            return None
+        if time.monotonic() - self.turn.time > self.ttl:
+            self.turn = None
+            return None
+        return self.turn
+
+    def cached_result(self, intent, slots):
+        """Result data from an earlier identical request, or None if missing or stale"""
+        key = self.key(intent, slots)
+        entry = self.results.get(key)
+        if entry is None:
+            return None
+        result, saved = entry
+        if time.monotonic() - saved > self.ttl:
+            del self.results[key]
+            return None
+        self.results.move_to_end(key)
+        return result
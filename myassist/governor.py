@@ -0,0 +1,167 @@
+import os
+import time
+import queue
+import threading
+from collections import Counter
+
+
+class ServiceUnavailable(Exception):
+    """Raised when a call is refused by a rate limit or an open circuit breaker"""
+
+    def __init__(self, service, reason):
+        super().__init__(f"{service} is unavailable ({reason})")
+        self.service = service
+        self.reason = reason
+
+
+class TokenBucket:
+    """Allows bursts up to capacity, refilling at a steady rate per minute"""
+
+    def __init__(self, per_minute, capacity=None):
+        self.rate = per_minute / 60.0
+        self.capacity = capacity or max(1, per_minute)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def try_acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+class CircuitBreaker:
+    """Stops calling a service after repeated failures, retrying once after a cool-down"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold=3, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.state = self.CLOSED
+        self.opened_at = 0
+
+    def allow(self):
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            # Cool-down is over, let one trial call through
+            self.state = self.HALF_OPEN
+        return True
+
+    def record_success(self):
+        self.failures = 0
+        self.state = self.CLOSED
+
+    def record_failure(self):
+        """Count a failure. Returns True if this failure opened the circuit."""
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            was_open = self.state == self.OPEN
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            return not was_open
+        return False
+
+
+class ResourceGovernor:
+    """Rate limits, circuit breakers and queue backpressure for the assistant.
+
+    Every limit hit is recorded in `counters`, keyed as "<service>.<event>".
+    """
+
+    def __init__(self, rate_limits=None, default_rate=20, failure_threshold=3, reset_timeout=30):
+        # Calls per minute for each service; services not listed get default_rate
+        self.rate_limits = dict(rate_limits or {})
+        self.default_rate = default_rate
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.buckets = {}
+        self.breakers = {}
+        self.counters = Counter()
+        self.lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        """Build a governor from the limits configured in the environment / .env"""
+        return cls(
+            rate_limits={"recognition": int(os.getenv("RECOGNITION_RATE_LIMIT", "30"))},
+            default_rate=int(os.getenv("API_RATE_LIMIT", "20")),
+            failure_threshold=int(os.getenv("CIRCUIT_BREAKER_FAILURES", "3")),
+            reset_timeout=float(os.getenv("CIRCUIT_BREAKER_RESET", "30"))
+        )
+
+    def count(self, service, event):
+        with self.lock:
+            self.counters[f"{service}.{event}"] += 1
+
+    def bucket(self, service):
+        if service not in self.buckets:
+            self.buckets[service] = TokenBucket(self.rate_limits.get(service, self.default_rate))
+        return self.buckets[service]
+
+    def breaker(self, service):
+        if service not in self.breakers:
+            self.breakers[service] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+        return self.breakers[service]
+
+    def call(self, service, func, *args, failures=(Exception,), fallback=None, **kwargs):
+        """Call func under the service's rate limit and circuit breaker.
+
+        Exceptions listed in `failures` count against the breaker; anything
+        else (e.g. "no speech detected") passes straight through. When the
+        call is refused or fails, `fallback()` is used if given, otherwise
+        ServiceUnavailable is raised (or the original failure re-raised).
+        """
+        breaker = self.breaker(service)
+        if not breaker.allow():
+            self.count(service, "circuit_open")
+            return self._fallback(service, "circuit open", fallback)
+        if not self.bucket(service).try_acquire():
+            self.count(service, "rate_limited")
+            return self._fallback(service, "rate limited", fallback)
+
+        try:
+            result = func(*args, **kwargs)
+        except failures:
+            self.count(service, "failures")
+            if breaker.record_failure():
+                self.count(service, "circuit_opened")
+                print(f"{service} keeps failing, pausing it for {self.reset_timeout:g} seconds")
+            if fallback is None:
+                raise
+            return fallback()
+
+        breaker.record_success()
+        return result
+
+    def _fallback(self, service, reason, fallback):
+        if fallback is None:
+            raise ServiceUnavailable(service, reason)
+        self.count(service, "fallbacks")
+        return fallback()
+
+    def offer(self, bounded_queue, item, stage):
+        """Put an item on a bounded queue, dropping the oldest item when it is full"""
+        while True:
+            try:
+                bounded_queue.put_nowait(item)
+                return
+            except queue.Full:
+                self.count(stage, "dropped")
+                try:
+                    bounded_queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def stats(self):
+        with self.lock:
+            return dict(self.counters)
@@ -0,0 +1,145 @@
+import re
+
+# Soundex digit for each consonant group; vowels, h, w and y are dropped
+SOUNDEX_CODES = {}
+for letters, digit in [("bfpv", "1"), ("cgjkqsxz", "2"), ("dt", "3"), ("l", "4"), ("mn", "5"), ("r", "6")]:
+    for letter in letters:
+        SOUNDEX_CODES[letter] = digit
+
+
+def normalize(text):
+    """Lowercase and drop everything except letters, digits and spaces"""
+    return re.sub(r"[^a-z0-9 ]", "", text.lower())
+
+
+def soundex(word):
+    """Soundex-style key of a word, e.g. 'alexa' and 'alexia' both give 'A420'.
+
+    Unlike classic Soundex the first letter is folded into its sound group too,
+    so 'komputer' keys like 'computer' and 'elexa' like 'alexa'.
+    """
+    word = re.sub(r"[^a-z]", "", word.lower())
+    if not word:
+        return ""
+
+    key = SOUNDEX_CODES.get(word[0]) or ("A" if word[0] in "aeiou" else word[0].upper())
+    last = SOUNDEX_CODES.get(word[0], "")
+    for letter in word[1:]:
+        code = SOUNDEX_CODES.get(letter, "")
+        if code and code != last:
+            key += code
+            if len(key) == 4:
+                break
+        # h and w don't separate letters with the same code, vowels do
+        if letter not in "hw":
+            last = code
+    return key.ljust(4, "0")
+
+
+def edit_distance(a, b, max_distance):
+    """Levenshtein distance, giving up early once it exceeds max_distance"""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            ))
+        # Every cell in the row is already too far, no need to continue
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    return previous[-1]
+
+
+class PhoneticMatch:
+    """A phrase found in an utterance, with the word span it covered"""
+
+    def __init__(self, phrase, value, start, end, distance):
+        self.phrase = phrase
+        self.value = value
+        self.start = start
+        self.end = end
+        self.distance = distance
+
+    def __repr__(self):
+        return f"PhoneticMatch({self.phrase!r}, words {self.start}-{self.end}, distance={self.distance})"
+
+
+class PhoneticIndex:
+    """Sounds-like lookup for a fixed set of phrases.
+
+    Keys are computed once when phrases are added, so looking up an utterance
+    costs one dictionary probe per word window regardless of how many phrases
+    are indexed. Phrases are compared with their spaces removed so that split
+    recognitions like "a lexa" still line up with "alexa".
+    """
+
+    def __init__(self, phrases=None, min_length=4, max_edits=None, same_word_count=False):
+        # Phrases shorter than this are too ambiguous to match by sound
+        self.min_length = min_length
+        # Fixed edit limit instead of one that grows with phrase length
+        self.max_edits = max_edits
+        # Only compare word windows with as many words as the phrase, so "whats" can't match "what is"
+        self.same_word_count = same_word_count
+        self.max_words = 1
+        self.keys = {}
+        for phrase in phrases or []:
+            self.add(phrase)
+
+    def add(self, phrase, value=None):
+        compact = normalize(phrase).replace(" ", "")
+        if len(compact) < self.min_length:
+            return
+        word_count = len(phrase.split())
+        entry = (phrase, compact, word_count, value if value is not None else phrase)
+        self.keys.setdefault(soundex(compact), []).append(entry)
+        # Allow one extra word so a phrase split by the recognizer still fits
+        self.max_words = max(self.max_words, word_count + 1)
+
+    def max_distance(self, compact):
+        """Allowed edits grow with phrase length: 1 for 'alexa', 2 for 'computer'"""
+        if self.max_edits is not None:
+            return self.max_edits
+        return max(1, len(compact) // 3)
+
+    def find_all(self, text, at_start=False):
+        """Every indexed phrase that sounds like a window of words in the text.
+
+        With at_start only windows beginning at the first word are tried.
+        """
+        # Normalize word by word so match spans line up with the words of the original text
+        words = [normalize(word) for word in text.split()]
+        matches = []
+        for start in range(min(len(words), 1) if at_start else len(words)):
+            for end in range(start + 1, min(start + self.max_words, len(words)) + 1):
+                candidate = "".join(words[start:end])
+                for phrase, compact, word_count, value in self.keys.get(soundex(candidate), []):
+                    if self.same_word_count and end - start != word_count:
+                        continue
+                    limit = self.max_distance(compact)
+                    distance = edit_distance(candidate, compact, limit)
+                    if distance <= limit:
+                        matches.append(PhoneticMatch(phrase, value, start, end, distance))
+        return matches
+
+    def find(self, text, at_start=False):
+        """Best match in the text: closest first, then the longest span"""
+        matches = self.find_all(text, at_start)
+        if not matches:
+            return None
+        return min(matches, key=lambda match: (match.distance, match.start - match.end))
+
+    def remove(self, text, match):
+        """Drop the words a match covered from the text"""
+        return self.replace(text, match, "")
+
+    def replace(self, text, match, replacement):
+        """Swap the words a match covered for replacement, e.g. a misheard word for its keyword"""
+        words = text.split()
+        return " ".join(words[:match.start] + replacement.split() + words[match.end:])
@@ -0,0 +1,284 @@
+import os
+import re
+import json
+import importlib
+import importlib.util
+from phonetic import PhoneticIndex
+from context import parse_follow_up
+
+# Directory holding the built-in skills shipped with the assistant
+BUILTIN_SKILLS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "skills")
+
+# Entry point group third-party packages can use to register skills
+ENTRY_POINT_GROUP = "vocalassist.skills"
+
+
+class Intent:
+    """A single trigger declared in a skill manifest"""
+
+    def __init__(self, skill, spec):
+        self.skill = skill
+        self.name = spec["name"]
+        self.handler = spec.get("handler", spec["name"])
+        self.priority = spec.get("priority", 1000)
+        self.fallback = spec.get("fallback", False)
+        self.prefixes = spec.get("prefixes", [])
+        self.triggers = spec.get("triggers", [])
+        # Optional handler for elliptical follow-ups, and which slots it accepts ("subject", "day")
+        self.follow_up = spec.get("follow_up")
+        self.follow_up_slots = spec.get("follow_up_slots", ["subject"])
+        # Compile patterns once so matching never touches the skill module
+        self.patterns = [re.compile(pattern) for pattern in spec.get("patterns", [])]
+        # Whole-word versions of the prefixes and triggers, so "dayton" doesn't count as "day"
+        self.word_patterns = (
+            [re.compile(rf"^{re.escape(prefix)}\b") for prefix in self.prefixes]
+            + [re.compile(rf"\b{re.escape(trigger)}\b") for trigger in self.triggers]
+            + self.patterns
+        )
+
+    def matches(self, command):
+        """Check whether a command matches any of this intent's triggers"""
+        if any(command.startswith(prefix) for prefix in self.prefixes):
+            return True
+        if any(trigger in command for trigger in self.triggers):
+            return True
+        return any(pattern.search(command) for pattern in self.patterns)
+
+    def matches_words(self, command):
+        """Like matches(), but triggers must appear as whole words"""
+        return any(pattern.search(command) for pattern in self.word_patterns)
+
+
+class Skill:
+    """A skill described by a manifest, with its module imported on first use"""
+
+    def __init__(self, manifest, base_dir=None):
+        self.name = manifest["name"]
+        self.module_name = manifest["module"]
+        self.base_dir = base_dir
+        self.description = manifest.get("description", "")
+        self.intents = [Intent(self, spec) for spec in manifest.get("intents", [])]
+        self._module = None
+        # Set when the import fails, so a broken skill isn't imported again on every command
+        self.load_error = None
+
+    @property
+    def loaded(self):
+        return self._module is not None
+
+    def load(self):
+        """Import the skill module the first time one of its intents fires"""
+        if self.load_error is not None:
+            raise self.load_error
+        if self._module is None:
+            try:
+                if self.base_dir:
+                    # Directory skills are loaded from file so they don't need to be on sys.path
+                    path = os.path.join(self.base_dir, self.module_name + ".py")
+                    spec = importlib.util.spec_from_file_location(f"vocalassist_skills.{self.name}", path)
+                    module = importlib.util.module_from_spec(spec)
+                    spec.loader.exec_module(module)
+                    self._module = module
+                else:
+                    self._module = importlib.import_module(self.module_name)
+            except Exception as e:
+                self.load_error = e
+                raise
+        return self._module
+
+    def get_handler(self, intent, handler=None):
+        return getattr(self.load(), handler or intent.handler)
+
+
+class SkillRegistry:
+    """Discovers skills and routes commands to them in priority order"""
+
+    def __init__(self, skill_dirs=None, disabled=None, use_entry_points=True, fuzzy=True):
+        self.skills = {}
+        self.disabled = set(disabled or [])
+        self.intents = []
+        self.by_name = {}
+        self.fallback = None
+        self.fuzzy = fuzzy
+        self.keyword_index = PhoneticIndex()
+
+        for skill_dir in skill_dirs or [BUILTIN_SKILLS_DIR]:
+            self.discover_directory(skill_dir)
+        if use_entry_points:
+            self.discover_entry_points()
+
+        self._build_index()
+
+    def discover_directory(self, skill_dir):
+        """Register every manifest (*.json) found in a skills directory"""
+        if not os.path.isdir(skill_dir):
+            return
+
+        for filename in sorted(os.listdir(skill_dir)):
+            if not filename.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(skill_dir, filename), encoding="utf-8") as f:
+                    manifest = json.load(f)
+                self.register(manifest, base_dir=skill_dir)
+            except Exception as e:
+                print(f"Could not load skill manifest {filename}: {e}")
+
+    def discover_entry_points(self):
+        """Register skills published by installed packages under the entry point group"""
+        try:
+            from importlib.metadata import entry_points
+            try:
+                eps = entry_points(group=ENTRY_POINT_GROUP)
+            except TypeError:
+                # Python < 3.10 returns a dict of groups
+                eps = entry_points().get(ENTRY_POINT_GROUP, [])
+        except Exception:
+            return
+
+        for ep in eps:
+            try:
+                # The entry point should reference a lightweight manifest dict,
+                # the handler module named in it is still imported lazily
+                self.register(dict(ep.load()))
+            except Exception as e:
+                print(f"Could not load skill entry point {ep.name}: {e}")
+
+    def register(self, manifest, base_dir=None):
+        """Add a skill from its manifest unless it is disabled"""
+        if manifest["name"] in self.disabled:
+            return None
+        skill = Skill(manifest, base_dir)
+        # Later registrations override earlier ones with the same name
+        self.skills[skill.name] = skill
+        return skill
+
+    def _build_index(self):
+        self.intents = []
+        self.by_name = {}
+        self.fallback = None
+        # Short keywords like "day" or "time" sound like too many other words to match fuzzily,
+        # and looser matching sends ordinary speech ("i think so") to the wrong intent
+        self.keyword_index = PhoneticIndex(min_length=5, max_edits=1, same_word_count=True)
+        for skill in self.skills.values():
+            for intent in skill.intents:
+                self.by_name[intent.name] = intent
+                if intent.fallback:
+                    self.fallback = intent
+                else:
+                    self.intents.append(intent)
+                    for keyword in intent.triggers + intent.prefixes:
+                        self.keyword_index.add(keyword, intent)
+        self.intents.sort(key=lambda intent: intent.priority)
+
+    def match_exact(self, command):
+        """Return the first intent whose triggers appear in the command as-is"""
+        for intent in self.intents:
+            if intent.matches(command):
+                return intent
+        return None
+
+    def match_words(self, command):
+        """Return the first intent whose triggers appear in the command as whole words"""
+        for intent in self.intents:
+            if intent.matches_words(command):
+                return intent
+        return None
+
+    def route(self, command):
+        """Return the intent for a command and the command its handler should see.
+
+        When the intent is only found by sound, the misheard words are replaced
+        by the keyword they matched ("wether in paris" -> "weather in paris"),
+        so the handler's own parsing works on what the user meant.
+        """
+        intent = self.match_exact(command)
+        if intent is not None:
+            return intent, command
+
+        # Nothing matched exactly, try keywords that sound like what was heard
+        # before falling back to a web search
+        if self.fuzzy:
+            matches = self.keyword_index.find_all(command)
+            if matches:
+                best = min(matches, key=lambda match: (match.value.priority, match.distance))
+                return best.value, self.keyword_index.replace(command, best, best.phrase)
+        return self.fallback, command
+
+    def match(self, command):
+        """Return the first intent matching the command, or the fallback intent"""
+        return self.route(command)[0]
+
+    def resolve_follow_up(self, context, command):
+        """Match "and tomorrow?" / "what about paris?" against the previous exchange.
+
+        Returns (intent, previous slots, slot update) or None if the command
+        should be routed normally.
+        """
+        turn = context.last_turn()
+        if turn is None:
+            return None
+        intent = self.by_name.get(turn.intent)
+        if intent is None or not intent.follow_up:
+            return None
+
+        update = parse_follow_up(command)
+        if update is None or not set(update) <= set(intent.follow_up_slots):
+            return None
+        # "and what time is it" is a new request, not a follow-up, but places like
+        # "dayton" or "playa del carmen" only contain a trigger inside a word
+        if "subject" in update and self.match_words(update["subject"]) is not None:
+            return None
+        return intent, turn.slots, update
+
+    def dispatch(self, assistant, command):
+        """Run the handler for a command. Returns False when the assistant should stop."""
+        follow_up = self.resolve_follow_up(assistant.context, command)
+        if follow_up is not None:
+            intent, slots, update = follow_up
+            assistant.context.start_turn(intent.name)
+            handler = self._load_handler(assistant, intent, intent.follow_up)
+            if handler is None:
+                return True
+            result = handler(assistant, slots, update)
+            return result is not False
+
+        intent, command = self.route(command)
+        if intent is None:
+            assistant.speak("Sorry, I don't know how to help with that.")
+            return True
+
+        # Every exchange replaces the context, so a follow-up only ever refers to the last one
+        assistant.context.start_turn(intent.name)
+        handler = self._load_handler(assistant, intent)
+        if handler is None:
+            return True
+        result = handler(assistant, command)
+        return result is not False
+
+    def _load_handler(self, assistant, intent, handler=None):
+        """Import an intent's handler, or tell the user the skill can't be used and return None.
+
+        Skills are imported on first use, so a missing dependency or broken
+        skill module only shows up here and must not end the session.
+        """
+        try:
+            return intent.skill.get_handler(intent, handler)
+        except Exception as e:
+            print(f"Could not load skill {intent.skill.name}: {e}")
+            assistant.speak("Sorry, that skill isn't available.")
+            return None
+
+
+def disabled_skills_from_env():
+    """Read the comma separated DISABLED_SKILLS setting"""
+    value = os.getenv("DISABLED_SKILLS", "")
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+def skill_dirs_from_env():
+    """Built-in skills directory plus any extra directories listed in SKILLS_DIR"""
+    dirs = [BUILTIN_SKILLS_DIR]
+    extra = os.getenv("SKILLS_DIR", "")
+    dirs.extend(path for path in extra.split(os.pathsep) if path)
+    return dirs
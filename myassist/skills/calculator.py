@@ -0,0 +1,77 @@
+def calculate(assistant, expression):
+    """Calculate mathematical expression including scientific calculations"""
+    assistant.acknowledge()
+    
+    try:
+        # Clean up the expression
+        expression = expression.lower()
+        expression = expression.replace("calculate", "").replace("what is", "").replace("what's", "").strip()
+        
+        # Handle scientific terms
+        scientific_terms = {
+            'square root of': 'math.sqrt(',
+            'sqrt': 'math.sqrt(',
+            'power': '**',
+            'to the power of': '**',
+            'sin of': 'math.sin(',
+            'sine of': 'math.sin(',
+            'cos of': 'math.cos(',
+            'cosine of': 'math.cos(',
+            'tan of': 'math.tan(',
+            'tangent of': 'math.tan(',
+            'log of': 'math.log10(',
+            'natural log of': 'math.log(',
+            'ln of': 'math.log(',
+            'pi': 'math.pi',
+            'e': 'math.e',
+            'degrees': '* (180/math.pi)',
+            'radians': '* (math.pi/180)'
+        }
+        
+        # Replace scientific terms with their Python equivalents
+        for term, replacement in scientific_terms.items():
+            expression = expression.replace(term, replacement)
+            
+        # Replace basic operators
+        expression = expression.replace("x", "*").replace("divided by", "/")
+        expression = expression.replace("plus", "+").replace("minus", "-")
+        expression = expression.replace("times", "*").replace("multiplied by", "*")
+        
+        # Remove common words
+        expression = expression.replace("the", "").replace("sum of", "")
+        expression = expression.replace("product of", "").replace("equals", "")
+        
+        # Close any open parentheses from scientific functions
+        open_parens = expression.count('(')
+        close_parens = expression.count(')')
+        if open_parens > close_parens:
+            expression += ')' * (open_parens - close_parens)
+            
+        # Import math module for scientific calculations
+        import math
+        
+        # Safety check for valid characters
+        allowed_chars = set("0123456789+-*/.(). abcdefghijklmnopqrstuvwxyzmath")
+        if all(c in allowed_chars for c in expression):
+            result = eval(expression)
+            
+            # Format the result for better pronunciation
+            if isinstance(result, float):
+                # Check if it's close to a whole number
+                if abs(result - round(result)) < 1e-10:
+                    result = int(round(result))
+                else:
+                    # Round to 4 decimal places for scientific calculations
+                    result = round(result, 4)
+                    
+                # Handle very large or small numbers
+                if abs(result) > 1e6 or abs(result) < 1e-6:
+                    assistant.speak(f"The answer is {result:.2e}")
+                else:
+                    assistant.speak(f"The answer is {result}")
+            else:
+                assistant.speak(f"The answer is {result}")
+        else:
+            assistant.speak("Sorry, I can only calculate mathematical expressions.")
+    except Exception as e:
+        assistant.speak("Sorry, I couldn't calculate that. Please try rephrasing.")
@@ -0,0 +1,35 @@
+import re
+import datetime
+
+
+def tell_time(assistant, command):
+    """Tell the current time, or handle a time-in-location request"""
+    if "in" in command:  # Check if asking for time in a specific location
+        get_time_for_location(assistant, command)
+    else:
+        current_time = datetime.datetime.now().strftime("%I:%M %p")
+        assistant.speak(f"The time is {current_time}")
+
+
+def tell_date(assistant, command):
+    """Tell today's date"""
+    current_date = datetime.datetime.now().strftime("%A, %B %d, %Y")
+    assistant.speak(f"Today is {current_date}")
+
+
+def get_time_for_location(assistant, command):
+    """Get time for a specific location"""
+    assistant.acknowledge()
+    
+    try:
+        # Extract location name
+        location_match = re.search(r"time\s+in\s+(.+)", command)
+        if location_match:
+            location = location_match.group(1).strip()
+            # This would require a time zone API to be truly accurate
+            assistant.speak(f"I'm sorry, I don't have the capability to check time in {location} yet.")
+        else:
+            current_time = datetime.datetime.now().strftime("%I:%M %p")
+            assistant.speak(f"The time is {current_time}")
+    except Exception as e:
+        assistant.speak("Sorry, I couldn't get the time information.")
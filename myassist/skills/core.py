@@ -0,0 +1,28 @@
+import random
+
+
+def repeat_last_command(assistant, command):
+    """Repeat the last command"""
+    assistant.repeat_last_command()
+
+
+def identify(assistant, command):
+    """Introduce the assistant"""
+    assistant.speak("I'm Alexa, your personal voice assistant. I can help you with tasks, answer questions, play music, and keep you entertained.")
+
+
+def exit(assistant, command):
+    """Say goodbye and stop the main loop"""
+    assistant.speak("Goodbye! Have a great day!")
+    return False
+
+
+def help(assistant, command):
+    """List what the assistant can do"""
+    assistant.speak("As your Alexa-like assistant, I can tell you the time, date, weather, open websites, search the web, play music, control volume, set reminders, tell jokes, provide news updates, calculate math expressions, and answer general knowledge questions. Just ask me what you need!")
+
+
+def thank_you(assistant, command):
+    """Respond to thanks"""
+    responses = ["You're welcome!", "Happy to help!", "No problem!", "Anytime!", "My pleasure!"]
+    assistant.speak(random.choice(responses))
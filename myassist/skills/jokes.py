@@ -0,0 +1,8 @@
+import random
+
+
+def tell_joke(assistant, command):
+    """Tell a random joke"""
+    assistant.acknowledge()
+    joke = random.choice(assistant.jokes)
+    assistant.speak(joke)
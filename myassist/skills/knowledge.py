@@ -0,0 +1,44 @@
+import webbrowser
+import urllib.parse
+import requests
+import wikipedia
+from governor import ServiceUnavailable
+
+
+def wikipedia_follow_up(assistant, slots, update):
+    """Answer "what about ..." after a previous information query"""
+    get_wikipedia_info(assistant, update["subject"])
+
+
+def get_wikipedia_info(assistant, query):
+    """Get information from Wikipedia"""
+    assistant.acknowledge()
+    
+    try:
+        # Clean up the query
+        search_terms = ["who is", "what is", "tell me about", "wikipedia"]
+        for term in search_terms:
+            query = query.replace(term, "").strip()
+            
+        # Search Wikipedia, unless the same topic was looked up moments ago
+        results = assistant.context.cached_result("get_wikipedia_info", {"topic": query})
+        if results is None:
+            results = assistant.governor.call(
+                "wikipedia", wikipedia.summary, query, sentences=2,
+                failures=(requests.RequestException,)
+            )
+        assistant.context.record({"topic": query}, results)
+        assistant.speak(results)
+    except wikipedia.exceptions.DisambiguationError as e:
+        assistant.speak(f"There are multiple results for {query}. Please be more specific.")
+    except wikipedia.exceptions.PageError:
+        assistant.speak(f"I couldn't find any information about {query}.")
+        # Fall back to web search
+        assistant.speak("Let me search the web for you instead.")
+        webbrowser.open(f"https://www.google.com/search?q={urllib.parse.quote(query)}")
+    except (ServiceUnavailable, requests.RequestException):
+        # Wikipedia is limited or unreachable, let the browser handle it
+        assistant.speak("Wikipedia isn't responding right now, so I'll search the web instead.")
+        webbrowser.open(f"https://www.google.com/search?q={urllib.parse.quote(query)}")
+    except Exception as e:
+        assistant.speak("Sorry, I encountered an error while searching for information.")
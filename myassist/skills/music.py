@@ -0,0 +1,66 @@
+import re
+import webbrowser
+import urllib.parse
+
+
+def play_music(assistant, command):
+    """Play music on the preferred service"""
+    # Quick acknowledgement before processing
+    assistant.acknowledge()
+    
+    try:
+        # Extract song name with better pattern matching
+        play_patterns = [
+            r"play\s+(the song|song|track|)\s*(.*)",  # "play the song shape of you"
+            r"play\s+(.*)\s+(by|from)\s+(.*)",        # "play shape of you by ed sheeran"
+            r"play\s+(.*)"                            # "play shape of you"
+        ]
+        
+        song_title = None
+        artist = None
+        
+        for pattern in play_patterns:
+            match = re.search(pattern, command)
+            if match:
+                groups = match.groups()
+                if len(groups) == 2:  # Simple pattern
+                    song_title = groups[1].strip()
+                elif len(groups) == 3:  # With song indicator
+                    song_title = groups[1].strip()
+                    if "by" in command or "from" in command:
+                        artist_match = re.search(r"(by|from)\s+(.*)", command)
+                        if artist_match:
+                            artist = artist_match.group(2).strip()
+                elif len(groups) == 1:  # Just the title
+                    song_title = groups[0].strip()
+                break
+        
+        if not song_title:
+            song_title = command.replace("play", "").strip()
+        
+        # Different behavior based on music service preference
+        if assistant.music_service == "spotify":
+            # Would require Spotify API integration
+            assistant.speak(f"Playing {song_title}")
+            search_query = f"spotify:search:{song_title}"
+            if artist:
+                search_query += f" artist:{artist}"
+            webbrowser.open(search_query)
+        else:  # Default to YouTube
+            # More direct YouTube search that should start playing the first result
+            search_term = song_title
+            if artist:
+                search_term += f" {artist}"
+                
+            query = urllib.parse.quote(search_term)
+            # Use YouTube Music if possible for better music experience
+            webbrowser.open(f"https://music.youtube.com/search?q={query}")
+            
+            # Only speak after action is taken for faster response
+            if artist:
+                assistant.speak(f"Playing {song_title} by {artist}")
+            else:
+                assistant.speak(f"Playing {song_title}")
+            
+    except Exception as e:
+        assistant.speak(f"Sorry, I couldn't play that song.")
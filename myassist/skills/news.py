@@ -0,0 +1,37 @@
+import os
+import time
+import requests
+from governor import ServiceUnavailable
+
+
+def get_news(assistant, command):
+    """Get the latest news headlines"""
+    # Quick acknowledgement before fetching news
+    assistant.acknowledge()
+    
+    api_key = os.getenv("NEWS_API_KEY")
+    if not api_key:
+        assistant.speak("Sorry, I need a News API key to fetch the latest news.")
+        return
+        
+    try:
+        url = f"https://newsapi.org/v2/top-headlines?country=us&apiKey={api_key}"
+        response = assistant.governor.call(
+            "news", requests.get, url, timeout=5,
+            failures=(requests.RequestException,)
+        )
+        news = response.json()
+        
+        if response.status_code == 200 and news["totalResults"] > 0:
+            assistant.speak("Here are the top news headlines:")
+            
+            # Read top 3 news items
+            for i, article in enumerate(news["articles"][:3]):
+                assistant.speak(article["title"])
+                time.sleep(0.5)  # Shorter pause between headlines
+        else:
+            assistant.speak("Sorry, I couldn't fetch the latest news.")
+    except ServiceUnavailable:
+        assistant.speak("The news service isn't responding right now. Please try again in a little while.")
+    except Exception as e:
+        assistant.speak("Sorry, there was an error getting the news.")
@@ -0,0 +1,67 @@
+import datetime
+
+
+def set_reminder(assistant, command):
+    """Set a reminder for later"""
+    try:
+        # Parse time from command (simple implementation)
+        time_words = ["in", "after", "at"]
+        time_index = -1
+        
+        for word in time_words:
+            if word in command:
+                time_index = command.find(word)
+                break
+                
+        if time_index == -1:
+            assistant.speak("I couldn't understand when to set the reminder. Please try again.")
+            return
+            
+        time_part = command[time_index:]
+        reminder_text = command[:time_index].replace("remind me to", "").replace("set a reminder to", "").strip()
+        
+        # Very simple time parsing
+        minutes = 0
+        if "minute" in time_part or "minutes" in time_part:
+            for word in time_part.split():
+                if word.isdigit():
+                    minutes = int(word)
+                    break
+        elif "hour" in time_part or "hours" in time_part:
+            for word in time_part.split():
+                if word.isdigit():
+                    minutes = int(word) * 60
+                    break
+        elif "second" in time_part or "seconds" in time_part:
+            for word in time_part.split():
+                if word.isdigit():
+                    minutes = int(word) / 60  # Convert to minutes
+                    break
+                    
+        if minutes == 0:
+            assistant.speak("I couldn't understand the time. Please try again.")
+            return
+            
+        reminder_time = datetime.datetime.now() + datetime.timedelta(minutes=minutes)
+        assistant.reminders.append({"text": reminder_text, "time": reminder_time})
+        
+        # More natural Alexa-like response
+        if minutes < 1:
+            seconds = int(minutes * 60)
+            assistant.speak(f"I'll remind you to {reminder_text} in {seconds} seconds.")
+        elif minutes == 1:
+            assistant.speak(f"I'll remind you to {reminder_text} in 1 minute.")
+        elif minutes < 60:
+            assistant.speak(f"I'll remind you to {reminder_text} in {int(minutes)} minutes.")
+        elif minutes == 60:
+            assistant.speak(f"I'll remind you to {reminder_text} in 1 hour.")
+        else:
+            hours = minutes // 60
+            remaining_minutes = minutes % 60
+            time_str = f"{hours} {'hour' if hours == 1 else 'hours'}"
+            if remaining_minutes > 0:
+                time_str += f" and {remaining_minutes} {'minute' if remaining_minutes == 1 else 'minutes'}"
+            assistant.speak(f"I'll remind you to {reminder_text} in {time_str}.")
+        
+    except Exception as e:
+        assistant.speak("I had trouble setting that reminder. Please try again.")
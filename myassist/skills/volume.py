@@ -0,0 +1,40 @@
+import platform
+import subprocess
+
+
+def control_volume(assistant, command):
+    """Control system volume"""
+    assistant.acknowledge()  # Quick acknowledgement
+    
+    try:
+        if "up" in command or "increase" in command or "louder" in command or "raise" in command:
+            if platform.system() == "Windows":
+                # Increase volume on Windows
+                subprocess.call(["powershell", "-c", "(New-Object -ComObject WScript.Shell).SendKeys([char]175)"])
+            elif platform.system() == "Darwin":  # macOS
+                subprocess.call(["osascript", "-e", "set volume output volume (output volume of (get volume settings) + 10)"])
+            elif platform.system() == "Linux":
+                subprocess.call(["amixer", "-D", "pulse", "sset", "Master", "10%+"])
+            # No speak here for faster response, just acknowledgement
+            
+        elif "down" in command or "decrease" in command or "lower" in command:
+            if platform.system() == "Windows":
+                # Decrease volume on Windows
+                subprocess.call(["powershell", "-c", "(New-Object -ComObject WScript.Shell).SendKeys([char]174)"])
+            elif platform.system() == "Darwin":  # macOS
+                subprocess.call(["osascript", "-e", "set volume output volume (output volume of (get volume settings) - 10)"])
+            elif platform.system() == "Linux":
+                subprocess.call(["amixer", "-D", "pulse", "sset", "Master", "10%-"])
+            # No speak here for faster response
+            
+        elif "mute" in command:
+            if platform.system() == "Windows":
+                # Mute volume on Windows
+                subprocess.call(["powershell", "-c", "(New-Object -ComObject WScript.Shell).SendKeys([char]173)"])
+            elif platform.system() == "Darwin":  # macOS
+                subprocess.call(["osascript", "-e", "set volume with output muted"])
+            elif platform.system() == "Linux":
+                subprocess.call(["amixer", "-D", "pulse", "sset", "Master", "mute"])
+            assistant.speak("Muted")
+    except Exception as e:
+        assistant.speak("Sorry, I couldn't control the volume.")
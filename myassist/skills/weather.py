@@ -0,0 +1,157 @@
+import os
+import re
+import datetime
+import requests
+from governor import ServiceUnavailable
+
+# How many days ahead each supported day phrase is
+DAY_OFFSETS = {"today": 0, "tonight": 0, "tomorrow": 1, "day after tomorrow": 2}
+
+
+def parse_day(command):
+    """Find which day a weather request is about, defaulting to today"""
+    for day in sorted(DAY_OFFSETS, key=len, reverse=True):
+        if day in command:
+            return day
+    return "today"
+
+
+def weather(assistant, command):
+    """Route weather requests with or without a location"""
+    if "in" in command:  # Check if asking for weather in a specific location
+        get_location_weather(assistant, command)
+    else:
+        get_weather(assistant, assistant.default_city, parse_day(command))
+
+
+def weather_follow_up(assistant, slots, update):
+    """Answer "and tomorrow?" or "what about paris?" using the previous weather request"""
+    city = update.get("subject", slots.get("location"))
+    day = update.get("day", slots.get("day", "today"))
+    get_weather(assistant, city, day)
+
+
+def get_location_weather(assistant, command):
+    """Get weather for a specific location"""
+    assistant.acknowledge()
+    
+    try:
+        day = parse_day(command)
+        
+        # Extract city name
+        city_match = re.search(r"weather\s+in\s+(.+)", command)
+        if city_match:
+            city = city_match.group(1).strip()
+            # "weather in paris tomorrow" -> "paris"
+            city = re.sub(r"\s+(?:for\s+)?" + re.escape(day) + r"$", "", city)
+        else:
+            city = assistant.default_city
+            
+        get_weather(assistant, city, day)
+    except Exception as e:
+        assistant.speak("Sorry, I couldn't get weather information for that location.")
+
+
+def fetch_current(assistant, city, api_key):
+    """Current conditions for a city, or None if the city wasn't found"""
+    url = f"http://api.openweathermap.org/data/2.5/weather?q={city}&appid={api_key}&units=metric"
+    response = assistant.governor.call(
+        "weather", requests.get, url, timeout=5,
+        failures=(requests.RequestException,)
+    )
+    if response.status_code != 200:
+        return None
+        
+    data = response.json()
+    return {
+        "temperature": data["main"]["temp"],
+        "description": data["weather"][0]["description"],
+        "humidity": data["main"]["humidity"]
+    }
+
+
+def fetch_forecast(assistant, city, api_key):
+    """Five day forecast for a city as (time, temperature, description) entries"""
+    url = f"http://api.openweathermap.org/data/2.5/forecast?q={city}&appid={api_key}&units=metric"
+    response = assistant.governor.call(
+        "weather", requests.get, url, timeout=5,
+        failures=(requests.RequestException,)
+    )
+    if response.status_code != 200:
+        return None
+        
+    # Keep only what the reports need so cached forecasts stay small
+    return [
+        (entry["dt_txt"], entry["main"]["temp"], entry["weather"][0]["description"])
+        for entry in response.json()["list"]
+    ]
+
+
+def current_report(city, data):
+    temperature = data["temperature"]
+    temperature_f = (temperature * 9/5) + 32  # Convert to Fahrenheit
+    humidity = data["humidity"]
+    
+    # More natural, Alexa-like response
+    weather_report = f"In {city}, it's {temperature:.1f}°C ({temperature_f:.1f}°F) with {data['description']}. "
+    
+    # Only add humidity if it's notable
+    if humidity > 70:
+        weather_report += f"The humidity is high at {humidity}%."
+    elif humidity < 30:
+        weather_report += f"The humidity is low at {humidity}%."
+    return weather_report
+
+
+def forecast_report(city, day, forecast):
+    date = (datetime.date.today() + datetime.timedelta(days=DAY_OFFSETS[day])).isoformat()
+    entries = [entry for entry in forecast if entry[0].startswith(date)]
+    if day == "tonight":
+        entries = [entry for entry in entries if entry[0][11:13] >= "18"] or entries
+    if not entries:
+        return None
+        
+    temperatures = [temperature for _, temperature, _ in entries]
+    # The middle of the day is the most representative description
+    description = entries[len(entries) // 2][2]
+    return (f"{day.capitalize()} in {city}, expect {description} with temperatures "
+            f"between {min(temperatures):.0f} and {max(temperatures):.0f}°C.")
+
+
+def get_weather(assistant, city=None, day="today"):
+    """Get weather information using OpenWeatherMap API"""
+    api_key = os.getenv("OPENWEATHERMAP_API_KEY")
+    if not api_key:
+        assistant.speak("Sorry, I need an API key to check the weather.")
+        return
+        
+    if not city:
+        city = assistant.default_city
+        
+    try:
+        # Repeat and follow-up requests reuse recent results instead of calling the API again
+        if day == "today":
+            data = assistant.context.cached_result("weather", {"location": city})
+            if data is None:
+                data = fetch_current(assistant, city, api_key)
+                if data is not None:
+                    assistant.context.cache_result("weather", {"location": city}, data)
+            report = current_report(city, data) if data is not None else None
+        else:
+            # One forecast lookup covers tonight, tomorrow and the day after
+            forecast = assistant.context.cached_result("weather_forecast", {"location": city})
+            if forecast is None:
+                forecast = fetch_forecast(assistant, city, api_key)
+                if forecast is not None:
+                    assistant.context.cache_result("weather_forecast", {"location": city}, forecast)
+            report = forecast_report(city, day, forecast) if forecast is not None else None
+            
+        if report:
+            assistant.context.record({"location": city, "day": day})
+            assistant.speak(report)
+        else:
+            assistant.speak(f"Sorry, I couldn't get the weather information for {city}.")
+    except ServiceUnavailable:
+        assistant.speak("The weather service isn't responding right now. Please try again in a little while.")
+    except Exception as e:
+        assistant.speak("Sorry, there was an error getting the weather information.")
@@ -0,0 +1,53 @@
+import re
+import webbrowser
+import urllib.parse
+
+
+def open_website(assistant, command):
+    """Open a well-known website, a maps location or any named site"""
+    assistant.acknowledge()  # Quick acknowledgement
+    
+    if "youtube" in command:
+        webbrowser.open("https://www.youtube.com")
+        assistant.speak("Opening YouTube")
+    elif "google" in command:
+        webbrowser.open("https://www.google.com")
+        assistant.speak("Opening Google")
+    elif "amazon" in command:
+        webbrowser.open("https://www.amazon.com")
+        assistant.speak("Opening Amazon")
+    elif "netflix" in command:
+        webbrowser.open("https://www.netflix.com")
+        assistant.speak("Opening Netflix")
+    elif "maps" in command or "google maps" in command:
+        # Extract location if provided
+        location_match = re.search(r"open\s+maps\s+(for|to|of)\s+(.+)", command)
+        if location_match:
+            location = location_match.group(2).strip()
+            webbrowser.open(f"https://www.google.com/maps/search/{urllib.parse.quote(location)}")
+            assistant.speak(f"Opening maps for {location}")
+        else:
+            webbrowser.open("https://www.google.com/maps")
+            assistant.speak("Opening Google Maps")
+    else:
+        # Try to open any website mentioned
+        website_match = re.search(r"open\s+(?:the\s+)?(?:website\s+)?(.+?)(?:\s+website)?$", command)
+        if website_match:
+            site = website_match.group(1).strip()
+            webbrowser.open(f"https://www.{site}.com")
+            assistant.speak(f"Opening {site}")
+
+
+def web_search(assistant, command):
+    """Search Google for the spoken query"""
+    assistant.acknowledge()
+    search_query = command.replace("search", "").replace("google", "").replace("for", "").replace("look up", "").strip()
+    if search_query:
+        webbrowser.open(f"https://www.google.com/search?q={urllib.parse.quote(search_query)}")
+        assistant.speak(f"Searching for {search_query}")
+
+
+def fallback_search(assistant, command):
+    """Handle unknown commands as a web search"""
+    assistant.speak("I'm searching for information about that")
+    webbrowser.open(f"https://www.google.com/search?q={urllib.parse.quote(command)}")
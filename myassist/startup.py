@@ -0,0 +1,107 @@
+import os
+import sys
+import json
+import time
+import platform
+
+# Bump when the snapshot layout changes so old files are ignored.
+# Version 1 also stored .env values; moving past it makes the next start overwrite them.
+SNAPSHOT_VERSION = 2
+
+DEFAULT_SNAPSHOT_PATH = os.path.join(os.path.expanduser("~"), ".cache", "vocalassist", "startup.json")
+
+
+class StartupProfiler:
+    """Collects how long each import and initialization phase of startup takes"""
+
+    def __init__(self):
+        self.phases = []
+        self.last = time.perf_counter()
+
+    def mark(self, phase):
+        """Attribute the time since the previous mark to this phase"""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+
+    def report(self):
+        width = max([len(phase) for phase, _ in self.phases] + [5])
+        lines = [f"  {phase:<{width}}  {elapsed * 1000:8.1f} ms" for phase, elapsed in self.phases]
+        total = sum(elapsed for _, elapsed in self.phases)
+        lines.append(f"  {'total':<{width}}  {total * 1000:8.1f} ms")
+        return "\n".join(lines)
+
+
+# Shared by every module taking part in startup; created as early as possible
+profiler = StartupProfiler()
+
+
+def find_env_file(start_dir):
+    """Find the .env file load_dotenv() would use, searching up from start_dir"""
+    path = os.path.abspath(start_dir)
+    while True:
+        candidate = os.path.join(path, ".env")
+        if os.path.isfile(candidate):
+            return candidate
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+def fingerprint(env_path):
+    """Everything the snapshot depends on; any change invalidates it"""
+    try:
+        from importlib.metadata import version
+        driver_version = version("pyttsx3")
+    except Exception:
+        driver_version = None
+
+    env_stat = None
+    if env_path:
+        stat = os.stat(env_path)
+        env_stat = [stat.st_mtime, stat.st_size]
+
+    return {
+        "version": SNAPSHOT_VERSION,
+        "python": sys.version.split()[0],
+        "platform": [platform.system(), platform.release()],
+        "driver": driver_version,
+        "env_path": env_path,
+        "env_stat": env_stat
+    }
+
+
+def load_snapshot(path, expected_fingerprint):
+    """Return the snapshot data if it exists and was taken under the same fingerprint"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if snapshot.get("fingerprint") != expected_fingerprint:
+        return None
+    return snapshot.get("data")
+
+
+def save_snapshot(path, current_fingerprint, data):
+    """Write the snapshot atomically, readable only by the current user"""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"fingerprint": current_fingerprint, "data": data}, f)
+        # Replace in one step so a crash never leaves a half-written snapshot
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Could not save startup snapshot: {e}")
+
+
+def snapshot_path_from_env():
+    """Snapshot location from STARTUP_SNAPSHOT; "off" disables snapshots"""
+    path = os.getenv("STARTUP_SNAPSHOT", DEFAULT_SNAPSHOT_PATH)
+    if path.lower() in ("", "off", "0", "false"):
+        return None
+    return os.path.expanduser(path)